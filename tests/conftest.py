@@ -0,0 +1,5 @@
+import os
+import sys
+
+# app.py is a top-level module, not a package - make it importable from the tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,122 @@
+import networkx as nx
+import pytest
+
+import app
+
+
+def test_centrality_option_defaults():
+    assert app.centrality_options({}) == {
+        'mode': 'auto', 'samples': None, 'error': None, 'seed': None, 'time_budget': None, 'weighted': False
+    }
+
+
+def test_centrality_options_parse_strings():
+    options = app.centrality_options({
+        'betweenness_mode': 'approximate', 'betweenness_samples': '200', 'betweenness_error': '0.05',
+        'betweenness_seed': '3', 'centrality_time_budget': '2.5', 'centrality_weighted': True
+    })
+    assert options == {
+        'mode': 'approximate', 'samples': 200, 'error': 0.05, 'seed': 3, 'time_budget': 2.5, 'weighted': True
+    }
+
+
+@pytest.mark.parametrize('body', [
+    {'betweenness_mode': 'fast'},
+    {'betweenness_samples': 0},
+    {'betweenness_samples': 'many'},
+    {'betweenness_error': -0.1},
+    {'betweenness_error': 0},
+    {'betweenness_error': 1.5},
+    {'betweenness_error': 'small'},
+    {'betweenness_seed': 'x'},
+    {'centrality_time_budget': 0},
+    {'centrality_time_budget': 'inf'},
+])
+def test_bad_centrality_options_are_rejected(body):
+    with pytest.raises(ValueError):
+        app.centrality_options(body)
+
+
+def test_route_answers_bad_centrality_options_with_400():
+    client = app.app.test_client()
+    response = client.post('/api/analysis/network-stats', json={'betweenness_error': -1})
+    assert response.status_code == 400
+    assert 'betweenness_error' in response.get_json()['error']
+
+
+def test_sample_size_meets_the_error_target():
+    n, error = 5000, 0.05
+    k = app.betweenness_samples_for_error(n, error)
+    assert app.betweenness_error_bound(n, k) <= error < app.betweenness_error_bound(n, k - 1)
+
+
+def test_approximate_betweenness_is_within_its_bound():
+    G = nx.connected_watts_strogatz_graph(300, 6, 0.1, seed=1)
+    exact = nx.betweenness_centrality(G)
+    values, details = app.compute_betweenness(G, mode='approximate', samples=150, seed=5)
+    assert details['method'] == 'approximate'
+    assert details['samples'] == 150
+    assert max(abs(values[v] - exact[v]) for v in G) <= details['error_bound']
+
+    again, _ = app.compute_betweenness(nx.Graph(G), mode='approximate', samples=150, seed=5)
+    assert again == values
+
+
+def test_samples_covering_every_node_are_exact():
+    G = nx.karate_club_graph()
+    values, details = app.compute_betweenness(G, mode='approximate', samples=G.number_of_nodes())
+    assert details['method'] == 'exact'
+    assert values == pytest.approx(nx.betweenness_centrality(G))
+
+
+def chunk_task(G, chunk, deadline=float('inf')):
+    return app.centrality_graph_payload(G, app.graph_csr(G)), chunk, deadline
+
+
+def test_betweenness_chunks_add_up_to_networkx():
+    G = nx.relabel_nodes(nx.connected_watts_strogatz_graph(80, 4, 0.2, seed=2), lambda v: v * 7 + 1)
+    nodes = list(G)
+    partials = [app._betweenness_chunk(chunk_task(G, nodes[i::3])) for i in range(3)]
+    csr = app.graph_csr(G)
+    betweenness = app._rescale_normalized(dict(zip(csr.nodes.tolist(), sum(partials).tolist())), len(G))
+    assert betweenness == pytest.approx(nx.betweenness_centrality(G), abs=1e-12)
+
+
+def test_closeness_chunk_matches_networkx():
+    G = nx.karate_club_graph()
+    expected = nx.closeness_centrality(G)
+    assert app._closeness_chunk(chunk_task(G, [0, 5, 33])) == pytest.approx([expected[v] for v in (0, 5, 33)])
+
+
+def test_chunk_past_its_deadline_gives_up():
+    G = nx.karate_club_graph()
+    assert app._betweenness_chunk(chunk_task(G, list(G), deadline=0)) is None
+    assert app._closeness_chunk(chunk_task(G, list(G), deadline=0)) is None
+
+
+@pytest.fixture(scope='module')
+def centrality_pool():
+    """Two pool workers used for every graph, closed after these tests"""
+    patch = pytest.MonkeyPatch()
+    patch.setattr(app, 'CENTRALITY_WORKERS', 2)
+    patch.setattr(app, 'CENTRALITY_PARALLEL_MIN_NODES', 0)
+    yield
+    app.close_centrality_pool()
+    patch.undo()
+
+
+def test_pool_betweenness_matches_networkx(centrality_pool):
+    G = nx.connected_watts_strogatz_graph(200, 6, 0.1, seed=3)
+    assert app.exact_betweenness(G) == pytest.approx(nx.betweenness_centrality(G), abs=1e-12)
+
+
+def test_pool_closeness_matches_networkx(centrality_pool):
+    G = nx.barabasi_albert_graph(200, 2, seed=4)
+    assert app.exact_closeness(G) == pytest.approx(nx.closeness_centrality(G))
+
+
+def test_timeout_leaves_the_pool_usable(centrality_pool):
+    with pytest.raises(TimeoutError):
+        app.exact_betweenness(nx.connected_watts_strogatz_graph(2000, 10, 0.1, seed=5), time_budget=0.05)
+    G = nx.karate_club_graph()
+    assert app.exact_betweenness(G, time_budget=10) == pytest.approx(nx.betweenness_centrality(G))
@@ -0,0 +1,55 @@
+import networkx as nx
+import pytest
+
+import app
+
+
+def two_cliques():
+    """Two 5-cliques joined by a single edge"""
+    G = nx.disjoint_union(nx.complete_graph(5), nx.complete_graph(5))
+    G.add_edge(0, 5)
+    return G
+
+
+def test_community_option_defaults():
+    assert app.community_options({}) == {'method': app.COMMUNITY_METHOD, 'resolution': 1.0, 'seed': None}
+
+
+def test_community_options_parse_strings():
+    options = app.community_options({'community_method': 'greedy', 'community_resolution': '0.5',
+                                     'community_seed': '9'})
+    assert options == {'method': 'greedy', 'resolution': 0.5, 'seed': 9}
+
+
+@pytest.mark.parametrize('body', [
+    {'community_method': 'spectral'},
+    {'community_resolution': 'high'},
+    {'community_resolution': -1},
+    {'community_resolution': 'nan'},
+    {'community_seed': 'x'},
+])
+def test_bad_community_options_are_rejected(body):
+    with pytest.raises(ValueError):
+        app.community_options(body)
+
+
+@pytest.mark.parametrize('method', app.COMMUNITY_METHODS)
+def test_detect_communities_finds_the_cliques(method):
+    membership, details = app.detect_communities(two_cliques(), method)
+    assert details['num_communities'] == 2
+    assert len({membership[v] for v in range(5)}) == 1
+    assert len({membership[v] for v in range(5, 10)}) == 1
+    assert details['modularity'] > 0.4
+
+
+def test_communities_are_numbered_by_size():
+    G = nx.disjoint_union(nx.complete_graph(3), nx.complete_graph(6))
+    membership, _ = app.detect_communities(G, 'greedy')
+    assert [len(c) for c in app.community_members(membership, 2)] == [6, 3]
+
+
+def test_louvain_is_reproducible_for_a_seed():
+    G = nx.connected_caveman_graph(6, 5)
+    first, _ = app.detect_communities(G, 'louvain', seed=3)
+    second, _ = app.detect_communities(nx.Graph(G), 'louvain', seed=3)
+    assert first == second
@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+import app
+
+
+class FakeCursor:
+    def execute(self, *args):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Just enough of a mysql.connector connection for the pool"""
+
+    def __init__(self, ping_seconds=0.0):
+        self.ping_seconds = ping_seconds
+        self.unread_result = False
+        self.closed = False
+        self.alive = True
+
+    def cursor(self):
+        return FakeCursor()
+
+    def ping(self, reconnect=False):
+        time.sleep(self.ping_seconds)
+        if not self.alive:
+            raise app.Error(msg='Lost connection')
+
+    def is_connected(self):
+        return self.alive and not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Every raw connection the pool opens, in order"""
+    opened = []
+
+    def connect(**config):
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    monkeypatch.setattr(app.mysql.connector, 'connect', connect)
+    monkeypatch.setattr(app, 'get_db_config', lambda: {})
+    return opened
+
+
+def test_released_connection_is_reused(connections):
+    pool = app.ConnectionPool(size=2, timeout=1, recycle=100, ping_after=100)
+    first = pool.acquire()
+    first.close()
+    second = pool.acquire()
+    assert second._raw is connections[0]
+    assert len(connections) == 1
+
+
+def test_double_close_returns_connection_once(connections):
+    pool = app.ConnectionPool(size=2, timeout=1, recycle=100, ping_after=100)
+    conn = pool.acquire()
+    conn.close()
+    conn.close()
+    assert pool.stats()['idle'] == 1
+    assert pool.stats()['open'] == 1
+
+
+def test_failed_ping_replaces_connection(connections):
+    pool = app.ConnectionPool(size=1, timeout=1, recycle=100, ping_after=0)
+    pool.acquire().close()
+    connections[0].alive = False
+
+    conn = pool.acquire()
+    assert conn._raw is connections[1]
+    assert connections[0].closed
+    assert pool.stats()['failed_health_checks'] == 1
+    assert pool.stats()['open'] == 1
+
+
+def test_exhausted_pool_times_out(connections):
+    pool = app.ConnectionPool(size=1, timeout=0.05, recycle=100, ping_after=100)
+    pool.acquire()
+    with pytest.raises(app.Error):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_ping_does_not_hold_the_lock(connections):
+    pool = app.ConnectionPool(size=2, timeout=2, recycle=100, ping_after=0)
+    pool.acquire().close()
+    connections[0].ping_seconds = 0.5
+
+    pinging = threading.Thread(target=pool.acquire)
+    pinging.start()
+    time.sleep(0.05)
+    started = time.monotonic()
+    pool.acquire()  # opens the second connection while the first is pinged
+    waited = time.monotonic() - started
+    pinging.join()
+    assert waited < 0.25
@@ -0,0 +1,78 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import app
+
+# 1 - 2 - 3 - 4, with 2 - 5 and 5 - 3
+EDGES = [(1, 2), (2, 3), (3, 4), (2, 5), (3, 5)]
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    """The (nodes, within, load_store) of every edge lookup, answered from EDGES"""
+    calls = []
+
+    def fetch(good_id=None, start_date=None, end_date=None, nodes=None, within=False, load_store=True):
+        calls.append((list(nodes), within, load_store))
+        nodes = set(nodes)
+        kept = [(s, t) for s, t in EDGES
+                if ((s in nodes) and (t in nodes) if within else (s in nodes) or (t in nodes))]
+        dates = np.full(len(kept), np.datetime64('1650-01-01'), dtype='datetime64[D]')
+        return (np.array([s for s, _ in kept], dtype=np.int64), np.array([t for _, t in kept], dtype=np.int64),
+                np.ones(len(kept), dtype=np.int64), dates, dates)
+
+    monkeypatch.setattr(app, 'fetch_network_edges', fetch)
+    monkeypatch.setattr(app, 'add_node_labels_global', lambda G: G)
+    return calls
+
+
+def test_radius_one(lookups):
+    G = app.build_individual_ego_network('1', radius=1)
+    assert sorted(G.edges()) == [(1, 2)]
+
+
+def test_radius_two_includes_ties_among_members(lookups):
+    G = app.build_individual_ego_network(2, radius=2)
+    assert nx.utils.edges_equal(G.edges(), EDGES)
+
+
+def test_lookups_never_load_the_edge_store(lookups):
+    app.build_individual_ego_network(1, radius=2)
+    assert [load_store for _, _, load_store in lookups] == [False, False, False]
+    assert lookups[-1][1]  # the last lookup keeps edges between members
+
+
+def test_network_over_the_node_cap_is_refused(lookups, monkeypatch):
+    monkeypatch.setattr(app, 'EGO_MAX_NODES', 3)
+    with pytest.raises(ValueError, match='more than 3 individuals'):
+        app.build_individual_ego_network(2, radius=2)
+    assert all(len(nodes) <= 3 for nodes, _, _ in lookups)
+
+
+@pytest.mark.parametrize('body, radius', [({}, 1), ({'radius': ''}, 1), ({'radius': 2}, 2), ({'radius': '1'}, 1)])
+def test_ego_radius(body, radius):
+    assert app.ego_radius(body) == radius
+
+
+@pytest.mark.parametrize('radius', [0, 3, -1, 'two', [1]])
+def test_bad_ego_radius_is_rejected(radius):
+    with pytest.raises(ValueError, match='radius'):
+        app.ego_radius({'radius': radius})
+
+
+def test_edge_store_is_not_loaded_for_lookups(monkeypatch):
+    store = app.EdgeStore()
+    monkeypatch.setattr(store, '_load', lambda: pytest.fail('edge store was loaded'))
+    assert store.edges(nodes=[1], load=False) is None
+    assert store.data is None
+
+
+def test_route_answers_bad_radius_with_400():
+    client = app.app.test_client()
+    with client.session_transaction() as session:
+        session['beta_authenticated'] = True
+    response = client.post('/api/analysis/individual-network',
+                           json={'individual_id': 1, 'analysis_type': 'ego_network', 'radius': 5})
+    assert response.status_code == 400
+    assert 'radius' in response.get_json()['error']
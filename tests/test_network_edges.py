@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import app
+
+
+def edge_rows(pairs, dates):
+    return {
+        'source': np.array([s for s, _ in pairs], dtype=np.int64),
+        'target': np.array([t for _, t in pairs], dtype=np.int64),
+        'timestamp': np.array(dates, dtype='datetime64[D]'),
+    }
+
+
+def test_edge_rows_from_every_query_are_combined(monkeypatch):
+    results = {
+        'q1': edge_rows([(1, 2), (2, 3)], ['1650-01-01', '1650-02-01']),
+        'q2': edge_rows([(1, 2)], ['1651-01-01']),
+        'q3': edge_rows([], []),
+    }
+    monkeypatch.setattr(app, 'fetch_columnar', lambda query, params=None, dtypes=None: results[query])
+
+    source, target, weight, first, last = app.fetch_edge_rows([('q1', []), ('q2', []), ('q3', [])])
+    assert source.tolist() == [1, 2]
+    assert target.tolist() == [2, 3]
+    assert weight.tolist() == [2, 1]
+    assert first.astype(str).tolist() == ['1650-01-01', '1650-02-01']
+    assert last.astype(str).tolist() == ['1651-01-01', '1650-02-01']
+
+
+def test_failed_edge_query_fails_the_build(monkeypatch):
+    def fetch(query, params=None, dtypes=None):
+        if query == 'q2':
+            raise RuntimeError('Lost connection')
+        return edge_rows([(1, 2)], ['1650-01-01'])
+
+    monkeypatch.setattr(app, 'fetch_columnar', fetch)
+    with pytest.raises(RuntimeError, match='Lost connection'):
+        app.fetch_edge_rows([('q1', []), ('q2', []), ('q3', [])])
+
+
+def test_aggregate_edge_rows_matches_pandas_groupby():
+    rng = np.random.default_rng(7)
+    size = 2000
+    source = rng.integers(0, 40, size)
+    target = rng.integers(0, 40, size)
+    timestamp = (np.datetime64('1600-01-01') + rng.integers(0, 20000, size)).astype('datetime64[D]')
+    timestamp[rng.random(size) < 0.1] = np.datetime64('NaT')  # undated acts
+
+    frame = pd.DataFrame({'source': source, 'target': target, 'timestamp': timestamp})
+    expected = frame.groupby(['source', 'target']).agg(
+        weight=('timestamp', 'size'), first_date=('timestamp', 'min'), last_date=('timestamp', 'max')
+    ).reset_index()
+
+    result = app.aggregate_edge_rows(source, target, timestamp)
+    assert result[0].tolist() == expected['source'].tolist()
+    assert result[1].tolist() == expected['target'].tolist()
+    assert result[2].tolist() == expected['weight'].tolist()
+    for dates, column in zip(result[3:], ['first_date', 'last_date']):
+        np.testing.assert_array_equal(dates, expected[column].to_numpy().astype('datetime64[D]'))
+
+
+def test_aggregate_edge_rows_without_rows():
+    empty = np.empty(0, dtype=np.int64)
+    source, target, weight, first, last = app.aggregate_edge_rows(empty, empty, np.empty(0, dtype='datetime64[D]'))
+    assert len(source) == len(target) == len(weight) == len(first) == len(last) == 0
+
+
+def test_edge_queries_share_one_grouped_statement(monkeypatch):
+    statements = []
+
+    def fetch(query, params=None, dtypes=None):
+        statements.append((query, params))
+        return {column: np.empty(0, dtype=dtype) for column, dtype in dtypes.items()}
+
+    monkeypatch.setattr(app, 'fetch_columnar', fetch)
+    queries = app.build_edge_queries('wheat', '1650-01-01', '1660-12-31', nodes=[5, 6])
+    app.fetch_aggregated_edges(queries)
+
+    (query, params), = statements
+    assert query.count('UNION ALL') == len(app.EDGE_ROLE_PAIRS) - 1
+    assert 'GROUP BY source, target' in query
+    assert params == ['wheat', '1650-01-01', '1660-12-31', 5, 6, 5, 6] * len(app.EDGE_ROLE_PAIRS)
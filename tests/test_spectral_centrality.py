@@ -0,0 +1,78 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+import app
+
+
+@pytest.fixture
+def graph():
+    G = nx.connected_watts_strogatz_graph(150, 6, 0.2, seed=8)
+    rng = np.random.default_rng(8)
+    for u, v in G.edges():
+        G[u][v]['weight'] = int(rng.integers(1, 5))
+    return G
+
+
+def spectral(G, kind, weighted=False):
+    return app.spectral_centrality(G, kind, weighted)[0]
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_pagerank_matches_networkx(graph, weighted):
+    expected = nx.pagerank(graph, weight='weight' if weighted else None, tol=1e-10)
+    # Both stop once the L1 change is below n * SPECTRAL_TOL
+    assert spectral(graph, 'pagerank', weighted) == pytest.approx(expected, abs=len(graph) * app.SPECTRAL_TOL)
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_eigenvector_matches_networkx(graph, weighted):
+    expected = nx.eigenvector_centrality_numpy(graph, weight='weight' if weighted else None)
+    assert spectral(graph, 'eigenvector', weighted) == pytest.approx(expected, abs=1e-6)
+
+
+def test_katz_matches_networkx(graph):
+    values, details = app.spectral_centrality(graph, 'katz')
+    expected = nx.katz_centrality_numpy(graph, alpha=details['alpha'], weight=None)
+    assert values == pytest.approx(expected, abs=1e-6)
+
+
+def test_hits_matches_networkx_on_a_non_degenerate_graph(graph):
+    hubs, authorities = nx.hits(graph, tol=1e-12)  # weighted
+    assert spectral(graph, 'hub', True) == pytest.approx(hubs, abs=1e-6)
+    assert spectral(graph, 'authority', True) == pytest.approx(authorities, abs=1e-6)
+
+
+@pytest.mark.parametrize('G, orbits', [
+    (nx.path_graph(2), [[0, 1]]),
+    (nx.star_graph(5), [[0], [1, 2, 3, 4, 5]]),
+    (nx.complete_bipartite_graph(3, 3), [[0, 1, 2, 3, 4, 5]]),
+])
+def test_hits_scores_symmetric_nodes_equally(G, orbits):
+    for kind in ('hub', 'authority'):
+        values = spectral(G, kind)
+        assert sum(values.values()) == pytest.approx(1)
+        for orbit in orbits:
+            assert max(values[v] for v in orbit) == pytest.approx(min(values[v] for v in orbit))
+
+
+def test_graph_without_edges_scores_zero():
+    G = nx.empty_graph(4)
+    values, details = app.spectral_centrality(G, 'pagerank')
+    assert values == dict.fromkeys(range(4), 0.0)
+    assert details['method'] == 'no edges'
+
+
+def test_unknown_measure_is_rejected(graph):
+    with pytest.raises(ValueError):
+        app.spectral_centrality(graph, 'harmonic')
+
+
+def test_failed_measure_is_logged_in_node_attributes(graph, monkeypatch, capsys):
+    def fail(*args):
+        raise nx.PowerIterationFailedConvergence(1)
+
+    monkeypatch.setattr(app, 'spectral_centrality', fail)
+    attributes = app.calculate_node_attributes(graph, color_by='pagerank', size_by='degree')
+    assert 'pagerank failed' in capsys.readouterr().out
+    assert all(a['color_value'] == 0 for a in attributes.values())
@@ -0,0 +1,61 @@
+import pandas as pd
+import pytest
+
+import app
+
+TABLES = list(app.TABLE_DISPLAY_NAMES)
+
+
+def answer(monkeypatch, *results):
+    """Make execute_query return these DataFrames in turn"""
+    results = list(results)
+    monkeypatch.setattr(app, 'execute_query', lambda query, params=None, cache_ttl=None: results.pop(0))
+
+
+def test_exact_counts(monkeypatch):
+    answer(monkeypatch, pd.DataFrame([{t: i for i, t in enumerate(TABLES)}]))
+    assert app.count_table_rows() == {t: i for i, t in enumerate(TABLES)}
+
+
+def test_estimates_treat_null_table_rows_as_zero(monkeypatch):
+    estimates = pd.DataFrame({
+        'table_name': TABLES[:2],
+        'table_rows': [None, 120],
+    })
+    answer(monkeypatch, estimates)
+    counts = app.count_table_rows(exact=False)
+    assert counts[TABLES[0]] == 0
+    assert counts[TABLES[1]] == 120
+    assert all(counts[t] == 0 for t in TABLES[2:])  # missing tables
+
+
+def test_failed_exact_count_falls_back_to_estimates(monkeypatch):
+    answer(monkeypatch, pd.DataFrame(), pd.DataFrame({'table_name': TABLES[:1], 'table_rows': [5]}))
+    assert app.count_table_rows()[TABLES[0]] == 5
+
+
+def test_failed_counts_return_none(monkeypatch):
+    answer(monkeypatch, pd.DataFrame(), pd.DataFrame())
+    assert app.count_table_rows() is None
+
+
+@pytest.fixture
+def stats_cache(monkeypatch):
+    monkeypatch.setattr(app, '_database_stats', {'stats': None, 'etag': None, 'expires_at': 0})
+    return app._database_stats
+
+
+def test_failed_recount_keeps_previous_counts(monkeypatch, stats_cache):
+    monkeypatch.setattr(app, 'count_table_rows', lambda exact=True: {'legal_acts': 3})
+    stats, etag = app.get_cached_database_stats()
+    assert stats == {'legal_acts': 3}
+
+    stats_cache['expires_at'] = 0
+    monkeypatch.setattr(app, 'count_table_rows', lambda exact=True: None)
+    assert app.get_cached_database_stats() == (stats, etag)
+
+
+def test_failed_first_count_is_not_cached(monkeypatch, stats_cache):
+    monkeypatch.setattr(app, 'count_table_rows', lambda exact=True: None)
+    assert app.get_cached_database_stats() == (None, None)
+    assert stats_cache['expires_at'] == 0
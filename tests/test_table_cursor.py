@@ -0,0 +1,62 @@
+import base64
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+import app
+
+KEYSET_VIEW = {'keyset': True}
+OFFSET_VIEW = {'keyset': False}
+
+
+def test_keyset_cursor_round_trip():
+    token = app.encode_table_cursor('name', True, key=['Smith', np.int64(42)])
+    assert app.decode_table_cursor(token, KEYSET_VIEW, 'name', True) == ['Smith', 42]
+
+
+def test_keyset_cursor_without_sort_column():
+    token = app.encode_table_cursor(None, False, key=[7])
+    assert app.decode_table_cursor(token, KEYSET_VIEW, None, False) == [7]
+
+
+def test_cursor_stores_dates_as_strings():
+    token = app.encode_table_cursor('date', False, key=[date(1650, 3, 1), 9])
+    assert app.decode_table_cursor(token, KEYSET_VIEW, 'date', False) == ['1650-03-01', 9]
+
+
+def test_offset_cursor_round_trip():
+    token = app.encode_table_cursor('name', False, offset=200)
+    assert app.decode_table_cursor(token, OFFSET_VIEW, 'name', False) == 200
+
+
+def test_cursor_is_url_safe():
+    token = app.encode_table_cursor('name', False, key=['???>>>', 1])
+    assert set(token) <= set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=')
+
+
+@pytest.mark.parametrize('sort_column, descending', [('other', True), ('name', False), (None, True)])
+def test_cursor_for_another_sort_is_rejected(sort_column, descending):
+    token = app.encode_table_cursor('name', True, key=['Smith', 42])
+    with pytest.raises(ValueError, match='different sort'):
+        app.decode_table_cursor(token, KEYSET_VIEW, sort_column, descending)
+
+
+def encode(position):
+    return base64.urlsafe_b64encode(json.dumps(position).encode('utf-8')).decode('ascii')
+
+
+@pytest.mark.parametrize('token, view', [
+    ('not a cursor', KEYSET_VIEW),
+    (encode(['name', True]), KEYSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'key': 'Smith'}), KEYSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'key': ['Smith']}), KEYSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'key': ['Smith', None]}), KEYSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'offset': -1}), OFFSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'offset': True}), OFFSET_VIEW),
+    (encode({'sort': 'name', 'desc': False, 'offset': '10'}), OFFSET_VIEW),
+])
+def test_malformed_cursor_is_rejected(token, view):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        app.decode_table_cursor(token, view, 'name', False)